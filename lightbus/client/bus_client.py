@@ -3,7 +3,7 @@ import logging
 from datetime import timedelta
 from functools import wraps
 from inspect import iscoroutinefunction
-from typing import List, Tuple, Coroutine, Union, Sequence, TYPE_CHECKING, Callable
+from typing import List, Tuple, Coroutine, Union, Sequence, TYPE_CHECKING, Callable, Iterable
 
 from lightbus.client.utilities import queue_exception_checker, Error, ErrorQueueType, OnError
 from lightbus.exceptions import (
@@ -20,9 +20,11 @@ from lightbus.utilities.async_tools import (
     call_every,
     call_on_schedule,
     cancel_and_log_exceptions,
+    use_eager_task_factory,
 )
 from lightbus.utilities.features import Feature, ALL_FEATURES
 from lightbus.utilities.frozendict import frozendict
+from lightbus.utilities.timer_wheel import TimerWheel
 
 if TYPE_CHECKING:
     # pylint: disable=unused-import,cyclic-import
@@ -42,6 +44,8 @@ __all__ = ["BusClient"]
 
 logger = logging.getLogger(__name__)
 
+_ALL_FEATURES_SET = frozenset(ALL_FEATURES)
+
 
 def raise_queued_errors(fn):
     """Decorator to raise any errors which have appeared on the bus' error_queue during execution
@@ -108,6 +112,9 @@ class BusClient:
         self._background_coroutines = []
         # Tasks produced from the values in self._background_coroutines. Will be closed on bus shutdown
         self._background_tasks = []
+        # Drives the timers for all schedule/every tasks, rather than each
+        # background task holding its own timer on the event loop
+        self._timer_wheel = TimerWheel()
 
         self.features: List[Union[Feature, str]] = []
         self.set_features(ALL_FEATURES)
@@ -116,6 +123,10 @@ class BusClient:
         self._closed = False
         self._worker_tasks = set()
         self._lazy_load_complete = False
+        # Set once the worker starts, see the loop property
+        self._loop = None
+        # Set if the worker replaced the loop's task factory, so it can be put back on close
+        self._replaced_task_factory = False
 
         # Used to detect if the event monitor is running
         self._error_monitor_lock = asyncio.Lock()
@@ -133,11 +144,17 @@ class BusClient:
             raise BusAlreadyClosed()
 
         await cancel_and_log_exceptions(*self._background_tasks)
+        self._timer_wheel.close()
 
         await self.event_client.close()
         await self.rpc_result_client.close()
         await self.schema.close()
 
+        if self._replaced_task_factory:
+            # use_eager_task_factory() only ever replaces an unset task factory
+            self._loop.set_task_factory(None)
+            self._replaced_task_factory = False
+
         while not self.error_queue.empty():
             logger.error(self.error_queue.get_nowait())
 
@@ -145,7 +162,9 @@ class BusClient:
 
     @property
     def loop(self):
-        return get_event_loop()
+        # The loop is cached once the worker has started. Prior to that
+        # (i.e. when being used as a client only) we look it up each time
+        return self._loop or get_event_loop()
 
     def run_forever(self):
         block(self.start_worker())
@@ -166,7 +185,11 @@ class BusClient:
     async def start_worker(self):
         """Worker startup procedure"""
         # Ensure an event loop exists
-        get_event_loop()
+        self._loop = get_event_loop()
+        if self.config.bus().use_eager_task_factory:
+            previous_task_factory = self._loop.get_task_factory()
+            if use_eager_task_factory(self._loop) and previous_task_factory is None:
+                self._replaced_task_factory = True
 
         self._worker_tasks = set()
 
@@ -179,32 +202,36 @@ class BusClient:
         if not self.api_registry.all() and Feature.RPCS in self.features:
             logger.info("Disabling serving of RPCs as no APIs have been registered")
             self.features.remove(Feature.RPCS)
-
-        logger.info(
-            LBullets(
-                f"Enabled features ({len(self.features)})", items=[f.value for f in self.features]
+        # Taken once the features are final, for the membership tests below
+        features_set = frozenset(self.features)
+
+        # Only build the log messages if they are going to be shown
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                LBullets(
+                    f"Enabled features ({len(self.features)})",
+                    items=[f.value for f in self.features],
+                )
             )
-        )
 
-        disabled_features = set(ALL_FEATURES) - set(self.features)
-        logger.info(
-            LBullets(
-                f"Disabled features ({len(disabled_features)})",
-                items=[f.value for f in disabled_features],
+            disabled_features = _ALL_FEATURES_SET - features_set
+            logger.info(
+                LBullets(
+                    f"Disabled features ({len(disabled_features)})",
+                    items=[f.value for f in disabled_features],
+                )
             )
-        )
 
-        # Api logging
-        logger.info(
-            LBullets(
-                "APIs in registry ({})".format(len(self.api_registry.all())),
-                items=self.api_registry.names(),
+            # Api logging
+            logger.info(
+                LBullets(
+                    "APIs in registry ({})".format(len(self.api_registry.all())),
+                    items=self.api_registry.names(),
+                )
             )
-        )
 
         # Push all registered APIs into the global schema
-        for api in self.api_registry.all():
-            await self.schema.add_api(api)
+        await self.schema.add_apis(self.api_registry.all())
 
         # We're running as a worker now (e.g. lightbus run), so
         # do the lazy loading immediately
@@ -220,7 +247,7 @@ class BusClient:
         logger.info("Execution of before_worker_start & on_start hooks was successful")
 
         # Setup RPC consumption
-        if Feature.RPCS in self.features:
+        if Feature.RPCS in features_set:
             consume_rpc_task = asyncio.ensure_future(
                 queue_exception_checker(self.consume_rpcs(), self.error_queue)
             )
@@ -228,14 +255,21 @@ class BusClient:
             consume_rpc_task = None
 
         # Start off any registered event listeners
-        if Feature.EVENTS in self.features:
+        if Feature.EVENTS in features_set:
             await self.event_client.start_registered_listeners()
 
         # Start off any background tasks
-        if Feature.TASKS in self.features:
-            for coroutine in self._background_coroutines:
-                task = asyncio.ensure_future(queue_exception_checker(coroutine, self.error_queue))
-                self._background_tasks.append(task)
+        if Feature.TASKS in features_set:
+            self._timer_wheel.start()
+
+            # queue_exception_checker() always returns a coroutine (even when given
+            # a future), so we can create the tasks directly
+            self._background_tasks.extend(
+                [
+                    self._loop.create_task(queue_exception_checker(coroutine, self.error_queue))
+                    for coroutine in self._background_coroutines
+                ]
+            )
 
         self._worker_tasks.add(consume_rpc_task)
         self._worker_tasks.add(monitor_task)
@@ -292,17 +326,34 @@ class BusClient:
         self.loop.stop()
 
     def request_shutdown(self):
+        """Request that the worker shuts down
+
+        Safe to call from any thread. The shutdown is triggered by
+        placing an error on the error queue, which is picked up by
+        the error monitor.
+        """
         logger.debug("Requesting Lightbus shutdown")
-        self.error_queue.put_nowait(
-            Error(
-                type=KeyboardInterrupt,
-                value=KeyboardInterrupt("Shutdown requested"),
-                traceback=None,
-                invoking_stack=None,
-                exit_code=0,
-            )
+        error = Error(
+            type=KeyboardInterrupt,
+            value=KeyboardInterrupt("Shutdown requested"),
+            traceback=None,
+            invoking_stack=None,
+            exit_code=0,
         )
 
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        loop = self._loop
+        if loop is not None and loop.is_running() and running_loop is not loop:
+            # We're being called from another thread, so hand the error over
+            # to the worker's loop rather than waking its futures from here
+            loop.call_soon_threadsafe(self.error_queue.put_nowait, error)
+        else:
+            self.error_queue.put_nowait(error)
+
     async def lazy_load_now(self):
         """Perform lazy tasks immediately
 
@@ -321,27 +372,32 @@ class BusClient:
         logger.debug("Loading schema...")
         await self.schema.ensure_loaded_from_bus()
 
-        logger.info(
-            LBullets(
-                "Loaded the following remote schemas ({})".format(len(self.schema.remote_schemas)),
-                items=self.schema.remote_schemas.keys(),
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                LBullets(
+                    "Loaded the following remote schemas ({})".format(
+                        len(self.schema.remote_schemas)
+                    ),
+                    items=self.schema.remote_schemas.keys(),
+                )
             )
-        )
 
         # 2. Ensure the schema transport is loaded (other transports will be
         #    loaded as the need arises, but we need schema information from the get-go)
         await self.schema.ensure_loaded_from_bus()
 
         # 3. Add any local APIs to the schema
-        for api in self.api_registry.all():
-            await self.schema.add_api(api)
-
-        logger.info(
-            LBullets(
-                "Loaded the following local schemas ({})".format(len(self.schema.remote_schemas)),
-                items=self.schema.local_schemas.keys(),
+        await self.schema.add_apis(self.api_registry.all())
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                LBullets(
+                    "Loaded the following local schemas ({})".format(
+                        len(self.schema.local_schemas)
+                    ),
+                    items=self.schema.local_schemas.keys(),
+                )
             )
-        )
 
         # 4. Done
         self._lazy_load_complete = True
@@ -365,7 +421,8 @@ class BusClient:
 
         Call an RPC and return the result.
         """
-        await self.lazy_load_now()
+        if not self._lazy_load_complete:
+            await self.lazy_load_now()
         return await self.rpc_result_client.call_rpc_remote(
             api_name=api_name, name=name, kwargs=kwargs, options=options
         )
@@ -377,7 +434,8 @@ class BusClient:
         self, api_name, name, kwargs: dict = None, options: dict = None
     ) -> "EventMessage":
         """Fire an event onto the bus"""
-        await self.lazy_load_now()
+        if not self._lazy_load_complete:
+            await self.lazy_load_now()
         return await self.event_client.fire_event(
             api_name=api_name, name=name, kwargs=kwargs, options=options
         )
@@ -443,6 +501,13 @@ class BusClient:
         # Store coroutine for starting once the worker starts
         self._background_coroutines.append(coroutine)
 
+    def add_background_tasks(self, coroutines: Iterable[Union[Coroutine, asyncio.Future]]):
+        """Run several coroutines in the background
+
+        Equivalent to calling add_background_task() for each coroutine.
+        """
+        self._background_coroutines.extend(coroutines)
+
     # Utilities
 
     def set_features(self, features: List[Union[Feature, str]]):
@@ -607,7 +672,7 @@ class BusClient:
         This can also be used to decorate async functions. In this case the function will be awaited.
 
         Note that the timing is best effort and is not guaranteed. That being said, execution
-        time is accounted for.
+        time is accounted for. Timings have a resolution of 20 milliseconds.
 
         See Also:
 
@@ -627,7 +692,10 @@ class BusClient:
         #       has happened in cases where also_run_immediately=True.
         def wrapper(f):
             coroutine = call_every(  # pylint: assignment-from-no-return
-                callback=f, timedelta=td, also_run_immediately=also_run_immediately
+                callback=f,
+                timedelta=td,
+                also_run_immediately=also_run_immediately,
+                sleep=self._timer_wheel.sleep,
             )
             self.add_background_task(coroutine)
             return f
@@ -651,6 +719,8 @@ class BusClient:
 
         This can also be used to decorate async functions. In this case the function will be awaited.
 
+        Timings have a resolution of 20 milliseconds.
+
         See Also:
 
             @bus.client.every()
@@ -658,7 +728,10 @@ class BusClient:
 
         def wrapper(f):
             coroutine = call_on_schedule(
-                callback=f, schedule=schedule, also_run_immediately=also_run_immediately
+                callback=f,
+                schedule=schedule,
+                also_run_immediately=also_run_immediately,
+                sleep=self._timer_wheel.sleep,
             )
             self.add_background_task(coroutine)
             return f
@@ -1,4 +1,6 @@
 import asyncio
+import logging
+from typing import Iterable
 
 from lightbus.client.internal_messaging.consumer import InternalConsumer
 from lightbus.client.internal_messaging.producer import InternalProducer
@@ -8,6 +10,8 @@ from lightbus.config import Config
 from lightbus.transports.registry import TransportRegistry
 from lightbus.utilities.internal_queue import InternalQueue
 
+logger = logging.getLogger(__name__)
+
 
 class BaseDock:
     """The base dock
@@ -38,6 +42,29 @@ class BaseDock:
     async def handle(self, command):
         raise NotImplementedError()
 
+    async def close_transports(self, transports: Iterable):
+        """Close the given transports concurrently
+
+        Every transport will be closed, even if closing another fails. Any such
+        errors are logged, and the first is then raised.
+        """
+        transports = list(transports)
+        results = await asyncio.gather(
+            *[transport.close() for transport in transports], return_exceptions=True
+        )
+
+        ex = None
+        for transport, result in zip(transports, results):
+            if isinstance(result, Exception):
+                logger.exception(
+                    "Error encountered when closing transport %s", transport, exc_info=result
+                )
+                if ex is None:
+                    ex = result
+
+        if ex:
+            raise ex
+
     async def wait_until_ready(self):
         await self.producer.wait_until_ready()
         await self.consumer.wait_until_ready()
@@ -81,8 +81,8 @@ class EventDock(BaseDock):
     async def handle_close(self, command: commands.CloseCommand):
         await cancel(*self.listener_tasks)
 
-        for event_transport in self.transport_registry.get_all_event_transports():
-            await event_transport.close()
-
-        await self.consumer.close()
-        await self.producer.close()
+        try:
+            await self.close_transports(self.transport_registry.get_all_event_transports())
+        finally:
+            await self.consumer.close()
+            await self.producer.close()
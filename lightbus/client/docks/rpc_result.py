@@ -2,6 +2,7 @@ import asyncio
 import logging
 from functools import wraps
 from inspect import iscoroutinefunction
+from itertools import chain
 
 from typing import List
 
@@ -108,43 +109,79 @@ class RpcResultDock(BaseDock):
         options: dict,
         result_queue: InternalQueue,
     ):
+        # Rather than using asyncio.wait_for() (which wraps the receive_result()
+        # coroutine in a new task), we schedule a callback which cancels this
+        # listener's own task once the timeout expires
+        current_task = asyncio.current_task()
+        timed_out = False
+
+        def on_timeout():
+            nonlocal timed_out
+            timed_out = True
+            current_task.cancel()
+
+        timeout_handle = (
+            None if timeout is None else asyncio.get_running_loop().call_later(timeout, on_timeout)
+        )
+
         try:
             logger.debug("Result listener is waiting")
-            result = await asyncio.wait_for(
-                result_transport.receive_result(
+            try:
+                result = await result_transport.receive_result(
                     rpc_message=rpc_message, return_path=return_path, options=options
-                ),
-                timeout=timeout,
-            )
-        except asyncio.TimeoutError as e:
-            logger.debug("Result listener timed out")
-            await result_queue.put(e)
-        else:
-            logger.debug("Result listener received result, putting onto result queue")
+                )
+            except asyncio.CancelledError:
+                if not timed_out:
+                    raise
+                logger.debug("Result listener timed out")
+                result = asyncio.TimeoutError()
+            else:
+                logger.debug("Result listener received result, putting onto result queue")
+            finally:
+                # We have stopped waiting, so the timeout must not fire
+                # now, as it would cancel the put() below
+                if timeout_handle is not None:
+                    timeout_handle.cancel()
+
+            if timed_out and hasattr(current_task, "uncancel"):
+                # Python 3.11+. We have handled our own cancellation, so
+                # reset the task's cancellation count. Otherwise any enclosing
+                # asyncio.timeout() or TaskGroup would think it is still being cancelled
+                current_task.uncancel()
+
             await result_queue.put(result)
         finally:
-            self.listener_tasks.discard(asyncio.current_task())
+            self.listener_tasks.discard(current_task)
 
     @handle.register
     async def handle_close(self, command: commands.CloseCommand):
         """Client or worker wishes us to close down"""
-        await cancel(*self.consumer_tasks)
-        await cancel(*self.listener_tasks)
+        await cancel(*self.consumer_tasks, *self.listener_tasks)
 
-        for rpc_transport in self.transport_registry.get_all_rpc_transports():
-            await rpc_transport.close()
-        for rpc_transport in self.transport_registry.get_all_result_transports():
-            await rpc_transport.close()
-
-        await self.consumer.close()
-        await self.producer.close()
+        try:
+            await self.close_transports(
+                chain(
+                    self.transport_registry.get_all_rpc_transports(),
+                    self.transport_registry.get_all_result_transports(),
+                )
+            )
+        finally:
+            await self.consumer.close()
+            await self.producer.close()
 
     async def _consume_rpcs_with_transport(self, rpc_transport: RpcTransport, apis: List[Api]):
+        # Bind these once rather than on every iteration. This is particularly
+        # relevant for consume_rpcs(), as accessing methods on a
+        # transport pool creates a new wrapper function each time
+        consume_rpcs = rpc_transport.consume_rpcs
+        send = self.producer.send
+        ExecuteRpcCommand = commands.ExecuteRpcCommand
+
         while True:
             try:
-                rpc_messages = await rpc_transport.consume_rpcs(apis)
+                rpc_messages = await consume_rpcs(apis)
             except TransportIsClosed:
                 return
 
             for rpc_message in rpc_messages:
-                await self.producer.send(commands.ExecuteRpcCommand(message=rpc_message)).wait()
+                await send(ExecuteRpcCommand(message=rpc_message)).wait()
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict
 
 from lightbus.client.utilities import queue_exception_checker, ErrorQueueType
 from lightbus.utilities.async_tools import cancel
@@ -19,10 +19,13 @@ class InternalConsumer:
 
     def __init__(self, queue: InternalQueue, error_queue: ErrorQueueType):
         self._consumer_task: Optional[asyncio.Task] = None
-        self._running_commands = set()
+        # Maps each running command's task to the event to set once it is done
+        self._running_commands: Dict[asyncio.Task, asyncio.Event] = {}
         self._ready = asyncio.Event()
         self.queue = queue
         self.error_queue = error_queue
+        # Bind the done callback once, rather than creating a new one for every command
+        self._on_task_finished = self._when_task_finished
 
     def start(self, handler: Callable):
         """Set the handler function and start the invoker
@@ -36,7 +39,7 @@ class InternalConsumer:
         self._consumer_task = asyncio.ensure_future(
             queue_exception_checker(self._consumer_loop(self.queue, handler), self.error_queue)
         )
-        self._running_commands = set()
+        self._running_commands = {}
 
     async def close(self):
         """Shutdown the invoker and cancel any currently running tasks
@@ -75,24 +78,7 @@ class InternalConsumer:
 
         This execution happens in the background.
         """
-        logger.debug(f"Handling command {command}")
-
-        def when_task_finished(fut: asyncio.Future):
-            self._running_commands.remove(fut)
-            try:
-                # Retrieve any error which may have occurred.
-                # We ignore the error because we assume any exceptions which the
-                # handler threw will have already been placed into the error queue
-                # by the queue_exception_checker().
-                # Regardless, we must retrieve the result in order to keep Python happy.
-                fut.result()
-            except:
-                pass
-
-            # We use call_soon_threadsafe() to ensure we call the Event's set()
-            # in a threadsafe fashion. This is because the Event object may have
-            # been created in another thread and be attached to another event loop
-            on_done._loop.call_soon_threadsafe(on_done.set)
+        logger.debug("Handling command %s", command)
 
         # fmt: off
         background_call_task = asyncio.ensure_future(queue_exception_checker(
@@ -100,5 +86,22 @@ class InternalConsumer:
             self.error_queue,
         ))
         # fmt: on
-        background_call_task.add_done_callback(when_task_finished)
-        self._running_commands.add(background_call_task)
+        self._running_commands[background_call_task] = on_done
+        background_call_task.add_done_callback(self._on_task_finished)
+
+    def _when_task_finished(self, fut: asyncio.Future):
+        on_done = self._running_commands.pop(fut)
+        try:
+            # Retrieve any error which may have occurred.
+            # We ignore the error because we assume any exceptions which the
+            # handler threw will have already been placed into the error queue
+            # by the queue_exception_checker().
+            # Regardless, we must retrieve the result in order to keep Python happy.
+            fut.result()
+        except:
+            pass
+
+        # We use call_soon_threadsafe() to ensure we call the Event's set()
+        # in a threadsafe fashion. This is because the Event object may have
+        # been created in another thread and be attached to another event loop
+        on_done._loop.call_soon_threadsafe(on_done.set)
@@ -88,12 +88,15 @@ class EventClient(BaseSubClient):
 
         validate_outgoing(self.config, self.schema, event_message)
 
-        await self.hook_registry.execute("before_event_sent", event_message=event_message)
-        logger.info(L("📤  Sending event {}.{}".format(Bold(api_name), Bold(name))))
+        if self.hook_registry.should_execute("before_event_sent"):
+            await self.hook_registry.execute("before_event_sent", event_message=event_message)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(L("📤  Sending event {}.{}".format(Bold(api_name), Bold(name))))
 
         await self.producer.send(SendEventCommand(message=event_message, options=options)).wait()
 
-        await self.hook_registry.execute("after_event_sent", event_message=event_message)
+        if self.hook_registry.should_execute("after_event_sent"):
+            await self.hook_registry.execute("after_event_sent", event_message=event_message)
 
         return event_message
 
@@ -152,17 +155,21 @@ class EventClient(BaseSubClient):
     ):
 
         # TODO: Check events match those requested
-        logger.info(
-            L(
-                "📩  Received event {}.{} with ID {}".format(
-                    Bold(event_message.api_name), Bold(event_message.event_name), event_message.id
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                L(
+                    "📩  Received event {}.{} with ID {}".format(
+                        Bold(event_message.api_name),
+                        Bold(event_message.event_name),
+                        event_message.id,
+                    )
                 )
             )
-        )
 
         validate_incoming(self.config, self.schema, event_message)
 
-        await self.hook_registry.execute("before_event_execution", event_message=event_message)
+        if self.hook_registry.should_execute("before_event_execution"):
+            await self.hook_registry.execute("before_event_execution", event_message=event_message)
 
         if self.config.api(event_message.api_name).cast_values:
             parameters = cast_to_signature(parameters=event_message.kwargs, callable=listener)
@@ -201,7 +208,8 @@ class EventClient(BaseSubClient):
             AcknowledgeEventCommand(message=event_message, options=options)
         ).wait()
 
-        await self.hook_registry.execute("after_event_execution", event_message=event_message)
+        if self.hook_registry.should_execute("after_event_execution"):
+            await self.hook_registry.execute("after_event_execution", event_message=event_message)
 
     async def close(self):
         await super().close()
@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import time
 from asyncio import iscoroutinefunction, iscoroutine
 from typing import List
 
@@ -39,8 +38,11 @@ async def bail_on_error(error_queue: ErrorQueueType, co):
     """
 
     assert iscoroutine(co), "@bail_on_error only operates on coroutines"
-    fn_task = asyncio.ensure_future(co)
-    monitor_task = asyncio.ensure_future(error_queue.get())
+    # We know we have coroutines, so create the tasks directly rather
+    # than going via asyncio.ensure_future()
+    loop = asyncio.get_event_loop()
+    fn_task = loop.create_task(co)
+    monitor_task = loop.create_task(error_queue.get())
 
     done, pending = await asyncio.wait({fn_task, monitor_task}, return_when=asyncio.FIRST_COMPLETED)
 
@@ -94,13 +96,16 @@ class RpcResultClient(BaseSubClient):
         rpc_message = RpcMessage(api_name=api_name, procedure_name=name, kwargs=kwargs)
         validate_event_or_rpc_name(api_name, "rpc", name)
 
-        logger.info("📞  Calling remote RPC {}.{}".format(Bold(api_name), Bold(name)))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📞  Calling remote RPC {}.{}".format(Bold(api_name), Bold(name)))
 
-        start_time = time.time()
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
 
         validate_outgoing(self.config, self.schema, rpc_message)
 
-        await self.hook_registry.execute("before_rpc_call", rpc_message=rpc_message)
+        if self.hook_registry.should_execute("before_rpc_call"):
+            await self.hook_registry.execute("before_rpc_call", rpc_message=rpc_message)
 
         result_queue = InternalQueue()
 
@@ -120,7 +125,7 @@ class RpcResultClient(BaseSubClient):
         # The RpcResultDock will handle timeouts
         result = await bail_on_error(self.error_queue, result_queue.get())
 
-        call_time = time.time() - start_time
+        call_time = loop.time() - start_time
 
         try:
             if isinstance(result, Exception):
@@ -136,18 +141,20 @@ class RpcResultClient(BaseSubClient):
             assert isinstance(result, ResultMessage)
             result_message = result
 
-        await self.hook_registry.execute(
-            "after_rpc_call", rpc_message=rpc_message, result_message=result_message
-        )
+        if self.hook_registry.should_execute("after_rpc_call"):
+            await self.hook_registry.execute(
+                "after_rpc_call", rpc_message=rpc_message, result_message=result_message
+            )
 
         if not result_message.error:
-            logger.info(
-                L(
-                    "🏁  Remote call of {} completed in {}",
-                    Bold(rpc_message.canonical_name),
-                    human_time(call_time),
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    L(
+                        "🏁  Remote call of {} completed in {}",
+                        Bold(rpc_message.canonical_name),
+                        human_time(call_time),
+                    )
                 )
-            )
         else:
             logger.warning(
                 L(
@@ -171,7 +178,8 @@ class RpcResultClient(BaseSubClient):
         api = self.api_registry.get(api_name)
         validate_event_or_rpc_name(api_name, "rpc", name)
 
-        start_time = time.time()
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
         try:
             method = getattr(api, name)
             if self.config.api(api_name).cast_values:
@@ -186,19 +194,20 @@ class RpcResultClient(BaseSubClient):
                     "⚡  Error while executing {}.{}. Took {}",
                     Bold(api_name),
                     Bold(name),
-                    human_time(time.time() - start_time),
+                    human_time(loop.time() - start_time),
                 )
             )
             raise
         else:
-            logger.info(
-                L(
-                    "⚡  Executed {}.{} in {}",
-                    Bold(api_name),
-                    Bold(name),
-                    human_time(time.time() - start_time),
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    L(
+                        "⚡  Executed {}.{} in {}",
+                        Bold(api_name),
+                        Bold(name),
+                        human_time(loop.time() - start_time),
+                    )
                 )
-            )
             return result
 
     async def close(self):
@@ -217,7 +226,8 @@ class RpcResultClient(BaseSubClient):
         await self.schema.ensure_loaded_from_bus()
         validate_incoming(self.config, self.schema, command.message)
 
-        await self.hook_registry.execute("before_rpc_execution", rpc_message=command.message)
+        if self.hook_registry.should_execute("before_rpc_execution"):
+            await self.hook_registry.execute("before_rpc_execution", rpc_message=command.message)
         try:
             result = await self._call_rpc_local(
                 api_name=command.message.api_name,
@@ -240,9 +250,10 @@ class RpcResultClient(BaseSubClient):
             api_name=command.message.api_name,
             procedure_name=command.message.procedure_name,
         )
-        await self.hook_registry.execute(
-            "after_rpc_execution", rpc_message=command.message, result_message=result_message
-        )
+        if self.hook_registry.should_execute("after_rpc_execution"):
+            await self.hook_registry.execute(
+                "after_rpc_execution", rpc_message=command.message, result_message=result_message
+            )
 
         if not result_message.error:
             validate_outgoing(self.config, self.schema, result_message)
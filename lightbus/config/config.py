@@ -1,7 +1,7 @@
 import json as jsonlib
 import os
 from pathlib import Path
-from typing import Dict, NamedTuple, Union, TYPE_CHECKING
+from typing import Dict, NamedTuple, Optional, Union, TYPE_CHECKING
 import urllib.request
 
 import jsonschema
@@ -34,6 +34,8 @@ class Config:
 
     def __init__(self, root_config: "RootConfig"):
         self._config = root_config
+        # api() is called for every message sent & received, so cache its results
+        self._api_config_cache: Dict[Optional[str], "ApiConfig"] = {}
 
     def bus(self) -> "BusConfig":
         return self._config.bus
@@ -43,8 +45,16 @@ class Config:
 
         If there is no API-specific config available for the
         given api_name, then the root API config will be returned.
+
+        The returned ApiConfig is shared by every caller (and is cached),
+        so it must be treated as read-only.
         """
-        return self._config.apis.get(api_name, None) or self._config.apis["default"]
+        try:
+            return self._api_config_cache[api_name]
+        except KeyError:
+            api_config = self._config.apis.get(api_name, None) or self._config.apis["default"]
+            self._api_config_cache[api_name] = api_config
+            return api_config
 
     def apis(self) -> Dict[str, "ApiConfig"]:
         return self._config.apis
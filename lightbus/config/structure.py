@@ -127,6 +127,10 @@ class SchemaConfig(NamedTuple):
 class BusConfig(NamedTuple):
     log_level: LogLevelEnum = LogLevelEnum.INFO
     schema: SchemaConfig = SchemaConfig()
+    #: Use the uvloop event loop, if uvloop is installed
+    use_uvloop: bool = False
+    #: Use asyncio's eager task factory, if available (Python 3.12+)
+    use_eager_task_factory: bool = False
 
 
 class RootConfig:
@@ -17,7 +17,7 @@ from lightbus.client.utilities import ErrorQueueType
 from lightbus.hooks import HookRegistry
 from lightbus.internal_apis import LightbusStateApi, LightbusMetricsApi
 from lightbus.plugins import PluginRegistry
-from lightbus.utilities.async_tools import get_event_loop, block
+from lightbus.utilities.async_tools import get_event_loop, block, use_uvloop_policy
 from lightbus.utilities.internal_queue import InternalQueue
 from lightbus.utilities.features import ALL_FEATURES, Feature
 from lightbus.config.structure import RootConfig
@@ -81,10 +81,6 @@ def create_client(
             # Flask has a reloader process that shouldn't start a lightbus client
             return
 
-    # Ensure an event loop exists, as creating InternalQueue
-    # objects requires that we have one.
-    get_event_loop()
-
     # If were are running via the Lightbus CLI then we may have
     # some command line arguments we need to apply.
     # pylint: disable=cyclic-import,import-outside-toplevel
@@ -104,6 +100,14 @@ def create_client(
     elif isinstance(config, RootConfig):
         config = Config(config)
 
+    # The event loop policy must be set before the event loop is created
+    if config.bus().use_uvloop:
+        use_uvloop_policy()
+
+    # Ensure an event loop exists, as creating InternalQueue
+    # objects requires that we have one.
+    get_event_loop()
+
     transport_registry = kwargs.pop("transport_registry", None) or TransportRegistry().load_config(
         config
     )
@@ -129,7 +133,9 @@ def create_client(
     # Hook registry
     if not hook_registry:
         hook_registry = HookRegistry(
-            error_queue=error_queue, execute_plugin_hooks=plugin_registry.execute_hook
+            error_queue=error_queue,
+            execute_plugin_hooks=plugin_registry.execute_hook,
+            has_plugin_hook=plugin_registry.has_hook,
         )
 
     # API registry
@@ -1,6 +1,5 @@
-import asyncio
-from collections import defaultdict
-from typing import Dict, NamedTuple, List, Callable, Optional
+from asyncio import iscoroutinefunction
+from typing import Dict, NamedTuple, Tuple, Callable, Optional
 
 from lightbus.client.utilities import queue_exception_checker, ErrorQueueType
 from lightbus.utilities.async_tools import run_user_provided_callable
@@ -11,41 +10,78 @@ class CallbackKey(NamedTuple):
     run_before_plugins: bool
 
 
+class HookCallback(NamedTuple):
+    fn: Callable
+    # Determined upon registration, so we don't need to inspect the callback every time it is run
+    is_coroutine: bool
+
+
 class HookRegistry:
     def __init__(
         self,
         error_queue: ErrorQueueType,
         execute_plugin_hooks: Callable,
         extra_parameters: Optional[dict] = None,
+        has_plugin_hook: Optional[Callable[[str], bool]] = None,
     ):
-        self._hook_callbacks: Dict[CallbackKey, List[Callable]] = defaultdict(list)
+        # Callbacks are stored as tuples as they are iterated over on every
+        # hook execution, but only change when a new callback is registered
+        self._hook_callbacks: Dict[CallbackKey, Tuple[HookCallback, ...]] = {}
         self.error_queue = error_queue
         self.execute_plugin_hooks = execute_plugin_hooks
         self.extra_parameters = extra_parameters or {}
+        # If we can't ask if a plugin hook exists, then always assume it does
+        self.has_plugin_hook = has_plugin_hook or (lambda name: True)
 
     def set_extra_parameter(self, name, value):
         self.extra_parameters[name] = value
 
+    def should_execute(self, name) -> bool:
+        """Is there anything to run for the hook `name`?
+
+        This is synchronous, allowing callers on hot paths to avoid creating
+        and awaiting the execute() coroutine when there is nothing to do
+        (which is the common case).
+        """
+        return (
+            CallbackKey(name, run_before_plugins=True) in self._hook_callbacks
+            or CallbackKey(name, run_before_plugins=False) in self._hook_callbacks
+            or self.has_plugin_hook(name)
+        )
+
     async def execute(self, name, **kwargs):
+        """Execute the hook `name`
+
+        Callers on hot paths should check should_execute() first, as this
+        will always execute the plugin hooks.
+        """
+        before_callbacks = self._hook_callbacks.get(CallbackKey(name, run_before_plugins=True), ())
+        after_callbacks = self._hook_callbacks.get(CallbackKey(name, run_before_plugins=False), ())
+
+        # Raises a TypeError if kwargs duplicates any extra parameter
+        hook_kwargs = dict(**self.extra_parameters, **kwargs)
+
         # Hooks that need to run before plugins
-        key = CallbackKey(name, run_before_plugins=True)
-        for callback in self._hook_callbacks[key]:
+        for callback in before_callbacks:
             await queue_exception_checker(
-                run_user_provided_callable(
-                    callback, args=[], kwargs=dict(**self.extra_parameters, **kwargs)
-                ),
-                self.error_queue,
+                self._run_callback(callback, hook_kwargs), self.error_queue
             )
 
-        await self.execute_plugin_hooks(name, **self.extra_parameters, **kwargs)
+        await self.execute_plugin_hooks(name, **hook_kwargs)
 
         # Hooks that need to run after plugins
-        key = CallbackKey(name, run_before_plugins=False)
-        for callback in self._hook_callbacks[key]:
-            await run_user_provided_callable(
-                callback, args=[], kwargs=dict(**self.extra_parameters, **kwargs)
-            )
+        for callback in after_callbacks:
+            await self._run_callback(callback, hook_kwargs)
 
     def register_callback(self, name, fn, before_plugins=False):
         key = CallbackKey(name, bool(before_plugins))
-        self._hook_callbacks[key].append(fn)
+        callback = HookCallback(fn=fn, is_coroutine=iscoroutinefunction(fn))
+        self._hook_callbacks[key] = self._hook_callbacks.get(key, ()) + (callback,)
+
+    def _run_callback(self, callback: HookCallback, hook_kwargs: dict):
+        if callback.is_coroutine:
+            # Async callbacks can be called directly. Only blocking
+            # callbacks need to go via run_user_provided_callable()
+            return callback.fn(**hook_kwargs)
+        else:
+            return run_user_provided_callable(callback.fn, args=[], kwargs=hook_kwargs)
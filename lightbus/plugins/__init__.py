@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from argparse import ArgumentParser, _ArgumentGroup, Namespace
-from typing import Dict, Type, TypeVar, NamedTuple, TYPE_CHECKING
+from typing import Dict, Type, TypeVar, NamedTuple, FrozenSet, TYPE_CHECKING
 
 from collections import OrderedDict
 
@@ -163,6 +163,9 @@ class PluginRegistry:
 
     def __init__(self):
         self._plugins = []
+        # Names of the hooks provided by the loaded plugins, updated whenever
+        # the plugins change. Used by has_hook() which is called for every hook execution
+        self._hook_names: FrozenSet[str] = frozenset()
 
     def autoload_plugins(self, config: "Config"):
         """Autoload this registry with plugins from the 'lightbus_plugins' entrypoint"""
@@ -173,22 +176,29 @@ class PluginRegistry:
                     instantiate_plugin(config=config, plugin_config=plugin_config, cls=cls)
                 )
 
+        self._update_hook_names()
         return self._plugins
 
     def set_plugins(self, plugins: list):
         """Manually set the plugins in this registry"""
         self._plugins = plugins
+        self._update_hook_names()
 
     def is_plugin_loaded(self, plugin_class: Type[LightbusPlugin]):
         return plugin_class in [type(p) for p in self._plugins]
 
+    def has_hook(self, name) -> bool:
+        """Does any loaded plugin provide the hook `name`?
+
+        LightbusPlugin's own hooks do nothing, so only hooks which a plugin
+        overrides count. Allows callers to skip executing hooks entirely when
+        no plugin implements them.
+        """
+        self._validate_hook_name(name)
+        return name in self._hook_names
+
     async def execute_hook(self, name, **kwargs):
-        if name not in self.VALID_HOOK_NAMES:
-            raise PluginHookNotFound(
-                "Plugin hook '{}' could not be found. Must be one of: {}".format(
-                    name, ", ".join(self.VALID_HOOK_NAMES)
-                )
-            )
+        self._validate_hook_name(name)
 
         return_values = []
 
@@ -205,3 +215,26 @@ class PluginRegistry:
                     raise
 
         return return_values
+
+    def _update_hook_names(self):
+        self._hook_names = frozenset(
+            name
+            for name in self.VALID_HOOK_NAMES
+            if any(_overrides_hook(plugin, name) for plugin in self._plugins)
+        )
+
+    def _validate_hook_name(self, name):
+        if name not in self.VALID_HOOK_NAMES:
+            raise PluginHookNotFound(
+                "Plugin hook '{}' could not be found. Must be one of: {}".format(
+                    name, ", ".join(self.VALID_HOOK_NAMES)
+                )
+            )
+
+
+def _overrides_hook(plugin, name) -> bool:
+    """Does the plugin implement the hook `name`, rather than inheriting LightbusPlugin's no-op?"""
+    if name in getattr(plugin, "__dict__", {}):
+        # Set on the instance itself
+        return True
+    return getattr(type(plugin), name, None) is not getattr(LightbusPlugin, name, None)
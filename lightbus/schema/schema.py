@@ -3,7 +3,7 @@ import json
 import logging
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Optional, TextIO, Union, ChainMap, List, Tuple, Dict, TYPE_CHECKING
+from typing import Optional, TextIO, Union, ChainMap, List, Iterable, Tuple, Dict, TYPE_CHECKING
 import asyncio
 import itertools
 import sys
@@ -75,9 +75,13 @@ class Schema:
 
     async def add_api(self, api: "Api"):
         """Adds an API locally, and sends to the transport"""
-        schema = api_to_schema(api)
-        self.local_schemas[api.meta.name] = schema
-        await self.schema_transport.store(api.meta.name, schema, ttl_seconds=self.max_age_seconds)
+        await self.add_apis([api])
+
+    async def add_apis(self, apis: Iterable["Api"]):
+        """Adds several APIs locally, and sends them to the transport in one go"""
+        schemas = {api.meta.name: api_to_schema(api) for api in apis}
+        self.local_schemas.update(schemas)
+        await self.schema_transport.store_many(schemas, ttl_seconds=self.max_age_seconds)
 
     def get_api_schema(self, api_name) -> Optional[dict]:
         """Get the schema for the given API"""
@@ -257,8 +261,7 @@ class Schema:
 
         This will be done using the `schema_transport` provided to `__init__()`
         """
-        for api_name, schema in self.local_schemas.items():
-            await self.schema_transport.store(api_name, schema, ttl_seconds=self.max_age_seconds)
+        await self.schema_transport.store_many(self.local_schemas, ttl_seconds=self.max_age_seconds)
 
     async def load_from_bus(self):
         """Save the schema from the bus
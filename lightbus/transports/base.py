@@ -171,6 +171,16 @@ class SchemaTransport(Transport):
         """Store a schema for the given API"""
         raise NotImplementedError()
 
+    async def store_many(self, schemas: Dict[str, Dict], ttl_seconds: int):
+        """Store schemas for several APIs
+
+        `schemas` should be a mapping of API names to schemas. This
+        defaults to simply calling store() for each API. Backends may
+        choose to store the schemas in a single operation.
+        """
+        for api_name, schema in schemas.items():
+            await self.store(api_name, schema, ttl_seconds)
+
     async def ping(self, api_name: str, schema: Dict, ttl_seconds: int):
         """Keep alive a schema already stored via store()
 
@@ -40,14 +40,21 @@ class RedisSchemaTransport(RedisTransportMixin, SchemaTransport):
 
     async def store(self, api_name: str, schema: Dict, ttl_seconds: Optional[int]):
         """Store an individual schema"""
-        with await self.connection_manager() as redis:
-            schema_key = self.schema_key(api_name)
+        await self.store_many({api_name: schema}, ttl_seconds)
+
+    async def store_many(self, schemas: Dict[str, Dict], ttl_seconds: Optional[int]):
+        """Store several schemas using a single pipeline"""
+        if not schemas:
+            return
 
+        with await self.connection_manager() as redis:
             p = redis.pipeline()
-            p.set(schema_key, json_encode(schema))
-            if ttl_seconds is not None:
-                p.expire(schema_key, ttl_seconds)
-            p.sadd(self.schema_set_key(), api_name)
+            for api_name, schema in schemas.items():
+                schema_key = self.schema_key(api_name)
+                p.set(schema_key, json_encode(schema))
+                if ttl_seconds is not None:
+                    p.expire(schema_key, ttl_seconds)
+            p.sadd(self.schema_set_key(), *schemas.keys())
             await p.execute()
 
     async def load(self) -> Dict[str, Dict]:
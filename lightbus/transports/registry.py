@@ -48,6 +48,10 @@ class TransportRegistry:
 
     def __init__(self):
         self._registry: Dict[str, TransportRegistry._RegistryEntry] = {}
+        # Transport pools found by _get_transport_pool(), keyed by (api_name, transport_type).
+        # Lookups happen for every message sent, so we cache them here. The cache
+        # is cleared by _set_transport() whenever the registry changes.
+        self._transport_pool_cache: Dict[Tuple[str, str], AnyTransportPoolType] = {}
 
     def load_config(self, config: "Config") -> "TransportRegistry":
         # For every configured API...
@@ -111,9 +115,23 @@ class TransportRegistry:
         self._registry[api_name] = self._registry[api_name]._replace(
             **{transport_type: transport_pool}
         )
+        self._transport_pool_cache = {}
 
     def _get_transport_pool(
         self, api_name: str, transport_type: str, default=empty
+    ) -> AnyTransportPoolType:
+        try:
+            return self._transport_pool_cache[(api_name, transport_type)]
+        except KeyError:
+            pass
+
+        api_transport = self._find_transport_pool(api_name, transport_type, default)
+        if api_transport:
+            self._transport_pool_cache[(api_name, transport_type)] = api_transport
+        return api_transport
+
+    def _find_transport_pool(
+        self, api_name: str, transport_type: str, default=empty
     ) -> AnyTransportPoolType:
         # Get the registry entry for this API (if any)
         registry_entry = self._registry.get(api_name)
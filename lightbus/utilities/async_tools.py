@@ -3,14 +3,20 @@ import asyncio
 import logging
 import threading
 from concurrent.futures.thread import ThreadPoolExecutor
-from time import time
-from typing import Coroutine, TYPE_CHECKING
+from functools import partial
+from typing import Coroutine, List, Tuple, TYPE_CHECKING
 import datetime
 
 import aioredis
 
 from lightbus.exceptions import CannotBlockHere
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is an optional dependency, and is not available on Windows
+    uvloop = None
+
 if TYPE_CHECKING:
     # pylint: disable=unused-import,cyclic-import,cyclic-import
     from schedule import Job
@@ -49,22 +55,111 @@ def get_event_loop():
     try:
         loop = asyncio.get_event_loop()
     except RuntimeError:
-        loop = asyncio.new_event_loop()
+        # Create the loop via the current policy, so we respect
+        # any policy set by use_uvloop_policy()
+        loop = asyncio.get_event_loop_policy().new_event_loop()
         asyncio.set_event_loop(loop)
     return loop
 
 
+def use_uvloop_policy() -> bool:
+    """Switch the process-wide event loop policy to uvloop
+
+    This must happen before an event loop is created for the current thread,
+    otherwise that loop will continue to be used. lightbus.create() therefore
+    calls this before it ensures an event loop exists. The policy will not be
+    changed if an event loop is already running.
+
+    Returns True if the uvloop policy is in use, and False if uvloop
+    is not available (for example, on Windows). In the latter case Lightbus
+    will continue to use the standard asyncio event loop.
+    """
+    if uvloop is None:
+        logger.warning(
+            "The use_uvloop option is enabled, but uvloop could not be imported. "
+            "Falling back to the standard asyncio event loop. Install uvloop "
+            "using 'pip install uvloop' (uvloop is not available on Windows)."
+        )
+        return False
+
+    if isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        # Already in use
+        return True
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        logger.warning(
+            "The use_uvloop option is enabled, but an event loop is already running. "
+            "Will continue to use the current event loop."
+        )
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def use_eager_task_factory(loop) -> bool:
+    """Have the loop start executing new tasks immediately, where supported
+
+    Eager tasks run synchronously up to their first blocking await, rather than
+    waiting for the next iteration of the event loop. This requires Python 3.12+.
+
+    Any task factory which is already set on the loop will be left in place.
+
+    Returns True if the eager task factory is in use.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+
+    task_factory = loop.get_task_factory()
+    if task_factory is None:
+        loop.set_task_factory(eager_task_factory)
+        return True
+    else:
+        return task_factory is eager_task_factory
+
+
 async def cancel(*tasks):
     """Useful for cleaning up tasks in tests"""
+    exceptions = await _cancel_tasks(*tasks)
+
+    # Now raise the first exception we saw, if any
+    if exceptions:
+        raise exceptions[0][1]
+
+
+async def cancel_and_log_exceptions(*tasks):
+    """Cancel tasks and log any exceptions
+
+    This is useful when shutting down, when tasks need to be cancelled any anything
+    that goes wrong should be logged but will not otherwise be dealt with.
+
+    Tasks are cancelled concurrently.
+    """
+    for task, _ in await _cancel_tasks(*tasks):
+        logger.info(
+            "Error encountered when shutting down task %s. Exception logged, will now move on.",
+            task,
+        )
+
+
+async def _cancel_tasks(*tasks) -> List[Tuple[asyncio.Future, Exception]]:
+    """Cancel the given tasks, and return a list of any (task, exception) they raised"""
     # pylint: disable=broad-except
-    ex = None
-    for task in tasks:
-        if task is None:
-            continue
+    exceptions = []
+    tasks = [task for task in tasks if task is not None]
 
-        # Cancel all the tasks any pull out any exceptions
+    # Cancel all the tasks up front, so they all shut down concurrently
+    for task in tasks:
         if not task.cancelled():
             task.cancel()
+
+    # Now wait for each task and pull out any exceptions
+    for task in tasks:
         try:
             await task
             task.result()
@@ -83,31 +178,9 @@ async def cancel(*tasks):
             ):
                 pass
             else:
-                # If there was an exception, and this is the first
-                # exception we've seen, then stash it away for later
-                if ex is None:
-                    ex = e
+                exceptions.append((task, e))
 
-    # Now raise the first exception we saw, if any
-    if ex:
-        raise ex
-
-
-async def cancel_and_log_exceptions(*tasks):
-    """Cancel tasks and log any exceptions
-
-    This is useful when shutting down, when tasks need to be cancelled any anything
-    that goes wrong should be logged but will not otherwise be dealt with.
-    """
-    for task in tasks:
-        try:
-            await cancel(task)
-        except Exception as e:
-            # pylint: disable=broad-except
-            logger.info(
-                "Error encountered when shutting down task %s. Exception logged, will now move on.",
-                task,
-            )
+    return exceptions
 
 
 async def run_user_provided_callable(callable_, args, kwargs):
@@ -145,7 +218,9 @@ async def run_user_provided_callable(callable_, args, kwargs):
     raise exception
 
 
-async def call_every(*, callback, timedelta: datetime.timedelta, also_run_immediately: bool):
+async def call_every(
+    *, callback, timedelta: datetime.timedelta, also_run_immediately: bool, sleep=None
+):
     """Call callback every timedelta
 
     If also_run_immediately is set then the callback will be called before any waiting
@@ -154,27 +229,78 @@ async def call_every(*, callback, timedelta: datetime.timedelta, also_run_immedi
     Callback execution time is accounted for in the scheduling. If the execution takes
     2 seconds, and timedelta is 10 seconds, then call_every() will wait 8 seconds
     before the subsequent execution.
+
+    The waiting is done using asyncio.sleep(), unless an alternative is given
+    as `sleep` (for example, TimerWheel.sleep()).
     """
-    first_run = True
-    while True:
-        start_time = time()
-        if not first_run or also_run_immediately:
-            await run_user_provided_callable(callback, args=[], kwargs={})
-        total_execution_time = time() - start_time
-        sleep_time = max(0.0, timedelta.total_seconds() - total_execution_time)
-        await asyncio.sleep(sleep_time)
-        first_run = False
+    sleep = sleep or asyncio.sleep
+    run_callback = _make_callback_runner(callback)
+    loop = asyncio.get_event_loop()
+    seconds = timedelta.total_seconds()
 
+    if not also_run_immediately:
+        await sleep(seconds)
 
-async def call_on_schedule(callback, schedule: "Job", also_run_immediately: bool):
-    first_run = True
     while True:
+        deadline = loop.time() + seconds
+        await run_callback()
+        await sleep(max(0.0, deadline - loop.time()))
+
+
+async def call_on_schedule(callback, schedule: "Job", also_run_immediately: bool, sleep=None):
+    period = _get_constant_period(schedule)
+    if period is not None:
+        # The schedule is a simple fixed interval, so we can skip the schedule
+        # library's datetime calculations and just track the deadline ourselves
+        return await call_every(
+            callback=callback,
+            timedelta=datetime.timedelta(seconds=period),
+            also_run_immediately=also_run_immediately,
+            sleep=sleep,
+        )
+
+    sleep = sleep or asyncio.sleep
+    run_callback = _make_callback_runner(callback)
+
+    if not also_run_immediately:
         schedule._schedule_next_run()
+        td = schedule.next_run - datetime.datetime.now()
+        await sleep(max(0, td.total_seconds()))
 
-        if not first_run or also_run_immediately:
-            schedule.last_run = datetime.datetime.now()
-            await run_user_provided_callable(callback, args=[], kwargs={})
+    while True:
+        schedule._schedule_next_run()
+        schedule.last_run = datetime.datetime.now()
+        await run_callback()
 
+        # Sleep straight through to the next deadline rather than polling
+        # schedule.run_pending(). If the callback overran the deadline
+        # then we run again immediately.
         td = schedule.next_run - datetime.datetime.now()
-        await asyncio.sleep(td.total_seconds())
-        first_run = False
+        await sleep(max(0, td.total_seconds()))
+
+
+def _make_callback_runner(callback):
+    """Get a callable which will run the given callback, without any arguments
+
+    This is equivalent to run_user_provided_callable(), but determines how the
+    callback should be run once, rather than every time it is run.
+    """
+    if asyncio.iscoroutinefunction(callback):
+        return callback
+    else:
+        return partial(run_user_provided_callable, callback, args=[], kwargs={})
+
+
+def _get_constant_period(schedule: "Job"):
+    """Get the period of the schedule in seconds, if the schedule is a simple fixed interval
+
+    Returns None for schedules which the schedule library needs to calculate,
+    such as random intervals, or those tied to a time of day or day of the week.
+    """
+    if schedule.latest is not None or schedule.at_time is not None:
+        return None
+    if schedule.start_day is not None:
+        return None
+    if schedule.unit not in ("seconds", "minutes", "hours", "days", "weeks"):
+        return None
+    return datetime.timedelta(**{schedule.unit: schedule.interval}).total_seconds()
@@ -3,8 +3,10 @@ import datetime
 import inspect
 import logging
 from enum import Enum
+from types import MappingProxyType
 from typing import Mapping, Type, get_type_hints, Union, TypeVar, Callable, Any
 from base64 import b64decode
+from weakref import WeakKeyDictionary
 
 from lightbus.utilities.type_checks import (
     type_is_namedtuple,
@@ -36,7 +38,7 @@ def cast_to_signature(parameters: dict, callable) -> dict:
     Will resolve functions which have been wrapped using itertools.wrap()
     """
     casted_parameters = parameters.copy()
-    for key, hint in get_type_hints(callable).items():
+    for key, hint in get_callable_type_hints(callable).items():
         if key not in casted_parameters:
             continue
 
@@ -45,6 +47,34 @@ def cast_to_signature(parameters: dict, callable) -> dict:
     return casted_parameters
 
 
+def get_callable_type_hints(callable) -> Mapping[str, Any]:
+    """Get the type hints for a callable, caching the result where possible
+
+    get_type_hints() is relatively slow, and we need the hints for every
+    RPC executed and event received. The hints are returned as a read-only
+    mapping, as they are shared by all callers.
+    """
+    # Bound methods are created afresh upon each attribute access,
+    # so cache on the underlying function instead
+    callable = getattr(callable, "__func__", callable)
+    try:
+        return _type_hints_cache[callable]
+    except KeyError:
+        pass
+    except TypeError:
+        # Cannot be weakly referenced (or is unhashable), so cannot be cached
+        return MappingProxyType(get_type_hints(callable))
+
+    hints = MappingProxyType(get_type_hints(callable))
+    _type_hints_cache[callable] = hints
+    return hints
+
+
+# Weakly keyed, so that caching the hints of dynamically
+# created handlers doesn't stop them being garbage collected
+_type_hints_cache: "WeakKeyDictionary[Callable, Mapping[str, Any]]" = WeakKeyDictionary()
+
+
 V = TypeVar("V")
 H = TypeVar("A")
 
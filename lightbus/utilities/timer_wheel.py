@@ -0,0 +1,282 @@
+import asyncio
+import bisect
+import heapq
+import logging
+from itertools import count
+from math import ceil
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tie-breaker for overflow heap entries, so that heap comparisons
+# never fall through to comparing the Timer objects themselves
+_sequence = count()
+
+# The overflow heap is rebuilt without its cancelled timers once it holds more than
+# this many timers, and more than this fraction of them are cancelled (mirrors
+# the equivalent asyncio event loop logic)
+_MIN_OVERFLOW_TO_COMPACT = 100
+_MIN_CANCELLED_OVERFLOW_FRACTION = 0.5
+
+
+class Timer:
+    """A callback scheduled on a TimerWheel
+
+    Returned by TimerWheel.schedule(). Call cancel() to prevent the
+    callback from being run.
+    """
+
+    __slots__ = ("deadline", "tick", "callback", "args", "cancelled", "_overflow_wheel")
+
+    def __init__(self, deadline: float, tick: int, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        # Set while this timer is in a wheel's overflow heap
+        self._overflow_wheel: Optional["TimerWheel"] = None
+
+    def cancel(self):
+        if self.cancelled:
+            return
+        self.cancelled = True
+        if self._overflow_wheel is not None:
+            self._overflow_wheel._overflow_cancelled += 1
+        # Release any references held by the callback
+        self.callback = None
+        self.args = ()
+
+    def __repr__(self):
+        state = "cancelled" if self.cancelled else "pending"
+        return f"<Timer {state} deadline={self.deadline} callback={self.callback}>"
+
+
+class TimerWheel:
+    """Multiplexes many timers onto a single event loop timer
+
+    Timers are placed into one of `buckets` buckets, each covering `resolution`
+    seconds. Insertion and expiry are therefore O(1), rather than the O(log n)
+    of the event loop's own timer heap. Timers due beyond one revolution of the
+    wheel are held in an overflow heap and moved into the wheel as it comes round.
+    The occupied ticks are kept in a sorted list, so finding the next due
+    timer does not require scanning the wheel.
+
+    Timers will never fire early, but may fire up to `resolution` seconds late.
+
+    Timers will only fire once start() is called, and until close() is called.
+    Rather than a task driving the wheel, a single loop.call_at() wakeup is set for
+    when the next timer is due. It is only rescheduled when a newly scheduled timer
+    is due sooner than the current wakeup.
+    """
+
+    def __init__(self, resolution: float = 0.02, buckets: int = 512):
+        if buckets <= 0 or buckets & (buckets - 1):
+            raise ValueError(f"TimerWheel buckets must be a power of two, got {buckets}")
+        if resolution <= 0:
+            raise ValueError(f"TimerWheel resolution must be greater than zero, got {resolution}")
+
+        self.resolution = resolution
+        self.buckets = buckets
+        self._mask = buckets - 1
+        self._wheel: List[List[Timer]] = [[] for _ in range(buckets)]
+        # Heap of (tick, sequence, timer) tuples
+        self._overflow: List[Tuple[int, int, Timer]] = []
+        # Number of cancelled timers still in self._overflow
+        self._overflow_cancelled = 0
+        # Sorted list of the ticks which have timers waiting in self._wheel, so
+        # we can find the next due timer without scanning the entire wheel
+        self._pending_ticks: List[int] = []
+        # The last tick to have been expired. Ticks are counted from
+        # the loop's epoch, so set lazily once we know the loop
+        self._tick: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Wakeup state. The loop time the wheel will next wake at, or -1 if it
+        # is not waiting on any timer
+        self._running = False
+        self._next_wakeup: float = -1
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    def schedule(self, delay: float, callback: Callable, *args) -> Timer:
+        """Call callback(*args) in `delay` seconds
+
+        Much like loop.call_later(), but with a granularity of `resolution` seconds
+        """
+        if self._loop is None:
+            self._init_loop()
+
+        deadline = self._loop.time() + delay
+        # Round up, so we never fire early. Always wait for at least the next tick
+        tick = max(ceil(deadline / self.resolution), self._tick + 1)
+        timer = Timer(deadline, tick, callback, args)
+
+        if tick - self._tick <= self.buckets:
+            self._add_to_wheel(tick, timer)
+        else:
+            timer._overflow_wheel = self
+            heapq.heappush(self._overflow, (tick, next(_sequence), timer))
+
+        # Only reschedule the wakeup if this timer is due before the current one
+        wakeup = tick * self.resolution
+        if self._running and (self._next_wakeup < 0 or wakeup < self._next_wakeup):
+            self._arm(wakeup)
+
+        return timer
+
+    async def sleep(self, delay: float):
+        """Equivalent to asyncio.sleep(), but implemented using the wheel
+
+        Falls back to asyncio.sleep() if the wheel is not running (i.e. before
+        start() or after close()), as the wheel's timers would never fire.
+        """
+        if not self._running:
+            return await asyncio.sleep(delay)
+
+        future = self._loop.create_future()
+        timer = self.schedule(delay, _set_result_unless_done, future)
+        try:
+            return await future
+        finally:
+            timer.cancel()
+
+    def advance(self):
+        """Expire all timers up to the present time"""
+        if self._loop is None:
+            self._init_loop()
+
+        self._maybe_compact_overflow()
+
+        now_tick = int(self._loop.time() // self.resolution)
+        pending_ticks = self._pending_ticks
+        while self._tick < now_tick:
+            # Skip straight to the next tick which needs handling. That is either the
+            # next tick with timers in the wheel, or the next wrap of the wheel
+            # (at which point the overflow needs checking)
+            next_tick = now_tick
+            if pending_ticks and pending_ticks[0] < next_tick:
+                next_tick = pending_ticks[0]
+            if self._overflow:
+                next_tick = min(next_tick, (self._tick | self._mask) + 1)
+            self._tick = next_tick
+            index = self._tick & self._mask
+
+            if index == 0 and self._overflow:
+                # The wheel has come full circle, so pull in the overflow
+                # timers which now fall within its span
+                self._migrate_overflow()
+
+            if not pending_ticks or pending_ticks[0] != self._tick:
+                continue
+            del pending_ticks[0]
+            bucket = self._wheel[index]
+            self._wheel[index] = []
+
+            for timer in bucket:
+                if timer.cancelled:
+                    continue
+                try:
+                    timer.callback(*timer.args)
+                except Exception as e:
+                    logger.exception(e)
+
+    def start(self):
+        """Start firing timers
+
+        Must be called from within the event loop on which the timers are to fire
+        """
+        if self._loop is None:
+            self._init_loop()
+        self._running = True
+        self._arm_for_next_timer()
+
+    def close(self):
+        """Stop firing timers. Any pending timers will remain in the wheel"""
+        self._running = False
+        if self._wakeup_handle:
+            self._wakeup_handle.cancel()
+        self._wakeup_handle = None
+        self._next_wakeup = -1
+
+    def _init_loop(self):
+        # Bind to the running loop, rather than whatever loop happens to be current
+        self._loop = asyncio.get_running_loop()
+        self._tick = int(self._loop.time() // self.resolution)
+
+    def _arm(self, wakeup: float):
+        """Wake the wheel at the given loop time"""
+        if self._wakeup_handle:
+            self._wakeup_handle.cancel()
+        self._next_wakeup = wakeup
+        self._wakeup_handle = self._loop.call_at(wakeup, self._on_wakeup)
+
+    def _arm_for_next_timer(self):
+        next_wakeup = self._get_next_wakeup()
+        if next_wakeup is not None:
+            self._arm(next_wakeup)
+
+    def _on_wakeup(self):
+        self._wakeup_handle = None
+        self._next_wakeup = -1
+        self.advance()
+        if self._running:
+            self._arm_for_next_timer()
+
+    def _get_next_wakeup(self) -> Optional[float]:
+        """Get the loop time at which the next pending timer is due"""
+        ticks = []
+        overflow = self._overflow
+        while overflow and overflow[0][2].cancelled:
+            heapq.heappop(overflow)
+            self._overflow_cancelled -= 1
+        if overflow:
+            ticks.append(overflow[0][0])
+
+        pending_ticks = self._pending_ticks
+        while pending_ticks:
+            index = pending_ticks[0] & self._mask
+            if any(not timer.cancelled for timer in self._wheel[index]):
+                ticks.append(pending_ticks[0])
+                break
+            # Every timer in this bucket has been cancelled, so discard it
+            self._wheel[index] = []
+            del pending_ticks[0]
+
+        return min(ticks) * self.resolution if ticks else None
+
+    def _migrate_overflow(self):
+        horizon = self._tick + self.buckets
+        overflow = self._overflow
+        while overflow and overflow[0][0] < horizon:
+            tick, _, timer = heapq.heappop(overflow)
+            if timer.cancelled:
+                self._overflow_cancelled -= 1
+            else:
+                timer._overflow_wheel = None
+                self._add_to_wheel(tick, timer)
+
+    def _add_to_wheel(self, tick: int, timer: Timer):
+        bucket = self._wheel[tick & self._mask]
+        if not bucket:
+            bisect.insort(self._pending_ticks, tick)
+        bucket.append(timer)
+
+    def _maybe_compact_overflow(self):
+        """Rebuild the overflow heap if it is mostly made up of cancelled timers
+
+        Cancelled timers at the head of the heap are popped as we go, so this only
+        matters when many timers have been cancelled well ahead of their deadlines.
+        """
+        total = len(self._overflow)
+        if (
+            total > _MIN_OVERFLOW_TO_COMPACT
+            and self._overflow_cancelled / total > _MIN_CANCELLED_OVERFLOW_FRACTION
+        ):
+            self._overflow = [entry for entry in self._overflow if not entry[2].cancelled]
+            heapq.heapify(self._overflow)
+            self._overflow_cancelled = 0
+
+
+def _set_result_unless_done(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
@@ -87,4 +87,5 @@ setup(
     package_dir={"": "."},
     package_data={},
     install_requires=["aioredis>=1.2.0", "jsonschema>=3.2", "pyyaml>=3.12"],
+    extras_require={"uvloop": ["uvloop>=0.14"]},
 )
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import re
+import threading
 from unittest.mock import MagicMock
 from uuid import UUID
 
@@ -10,7 +11,7 @@ from typing import Type
 import lightbus
 import lightbus.creation
 import lightbus.path
-from lightbus import EventMessage, BusPath
+from lightbus import EventMessage, BusPath, DebugResultTransport, DebugEventTransport
 from lightbus.client.commands import (
     SendResultCommand,
     ConsumeEventsCommand,
@@ -26,7 +27,9 @@ from lightbus.exceptions import (
     InvalidName,
     DuplicateListenerName,
 )
-from lightbus.transports.registry import SchemaTransportPoolType
+from lightbus.plugins import LightbusPlugin
+from lightbus.transports.registry import SchemaTransportPoolType, TransportRegistry
+from lightbus.utilities.features import Feature
 from lightbus.utilities.testing import BusQueueMockerContext
 from tests.conftest import Worker
 
@@ -257,7 +260,7 @@ async def test_call_rpc_local_empty_name(dummy_bus: lightbus.path.BusPath, dummy
 @pytest.mark.asyncio
 async def test_no_transport(dummy_bus):
     # No transports configured for any relevant api
-    dummy_bus.client.transport_registry._registry = {}
+    dummy_bus.client.rpc_result_dock.transport_registry = TransportRegistry()
     with pytest.raises(TransportNotFound):
         await dummy_bus.client.call_rpc_remote("my_api", "test", kwargs={}, options={})
 
@@ -266,8 +269,14 @@ async def test_no_transport(dummy_bus):
 async def test_no_transport_type(dummy_bus):
     # Transports configured, but the wrong type of transport
     # No transports configured for any relevant api
-    registry_entry = dummy_bus.client.transport_registry._registry["default"]
-    dummy_bus.client.transport_registry._registry = {"default": registry_entry._replace(rpc=None)}
+    registry = TransportRegistry()
+    registry.set_result_transport(
+        "default", DebugResultTransport, DebugResultTransport.Config(), dummy_bus.client.config
+    )
+    registry.set_event_transport(
+        "default", DebugEventTransport, DebugEventTransport.Config(), dummy_bus.client.config
+    )
+    dummy_bus.client.rpc_result_dock.transport_registry = registry
     with pytest.raises(TransportNotFound):
         await dummy_bus.client.call_rpc_remote("my_api", "test", kwargs={}, options={})
 
@@ -283,6 +292,11 @@ async def test_setup_transports_opened(dummy_bus: BusPath, mocker):
     assert schema_transport_pool.total == 1
 
 
+def test_set_features(dummy_bus: lightbus.path.BusPath):
+    dummy_bus.client.set_features(["rpcs", Feature.EVENTS])
+    assert dummy_bus.client.features == [Feature.RPCS, Feature.EVENTS]
+
+
 def test_run_forever(dummy_bus: lightbus.path.BusPath, mocker, dummy_api):
     """A simple test to ensure run_forever executes without errors"""
     m = mocker.patch.object(dummy_bus.client.proxied_client, "_actually_run_forever")
@@ -290,6 +304,53 @@ def test_run_forever(dummy_bus: lightbus.path.BusPath, mocker, dummy_api):
     assert m.called
 
 
+@pytest.mark.parametrize("enabled", [True, False], ids=["enabled", "disabled"])
+def test_run_forever_eager_task_factory(dummy_bus: lightbus.path.BusPath, mocker, enabled):
+    def eager_task_factory(loop, coro):
+        return asyncio.Task(coro, loop=loop)
+
+    mocker.patch.object(asyncio, "eager_task_factory", eager_task_factory, create=True)
+    config = dummy_bus.client.config
+    config._config.bus = config.bus()._replace(use_eager_task_factory=enabled)
+
+    task_factories = []
+    mocker.patch.object(
+        dummy_bus.client.proxied_client,
+        "_actually_run_forever",
+        lambda: task_factories.append(dummy_bus.client.loop.get_task_factory()),
+    )
+    dummy_bus.client.run_forever()
+
+    assert task_factories == [eager_task_factory if enabled else None]
+    # The loop's original task factory is restored once the bus is closed
+    assert dummy_bus.client.loop.get_task_factory() is None
+
+
+def test_request_shutdown_from_thread(dummy_bus: lightbus.path.BusPath, mocker):
+    """Shutdown can be requested from a thread other than the worker's"""
+    call_soon_threadsafe = mocker.spy(dummy_bus.client.loop, "call_soon_threadsafe")
+
+    async def request_shutdown_in_thread():
+        thread = threading.Thread(target=dummy_bus.client.request_shutdown)
+        thread.start()
+        thread.join()
+
+    dummy_bus.client.add_background_task(request_shutdown_in_thread())
+    dummy_bus.client.run_forever()
+
+    assert dummy_bus.client.exit_code == 0
+    # The shutdown was handed over to the worker's loop, rather than
+    # the error queue being used directly from the other thread
+    call_soon_threadsafe.assert_any_call(dummy_bus.client.error_queue.put_nowait, mocker.ANY)
+
+
+@pytest.mark.asyncio
+async def test_hook_execute_duplicate_extra_parameter(dummy_bus: lightbus.path.BusPath):
+    # 'client' is always provided as an extra parameter
+    with pytest.raises(TypeError):
+        await dummy_bus.client.hook_registry.execute("before_worker_start", client=None)
+
+
 DECORATOR_HOOK_PAIRS = [
     ("on_start", "before_worker_start"),
     ("on_stop", "after_worker_stopped"),
@@ -340,6 +401,26 @@ async def test_hook_simple_call(dummy_bus: lightbus.path.BusPath, decorator, hoo
     assert count == 1
 
 
+@pytest.mark.parametrize("before_plugins", [True, False], ids=["before-plugins", "after-plugins"])
+def test_hook_should_execute(dummy_bus: lightbus.path.BusPath, before_plugins):
+    hook_registry = dummy_bus.client.hook_registry
+    assert not hook_registry.should_execute("before_rpc_call")
+
+    dummy_bus.client.before_rpc_call(lambda **kwargs: None, before_plugins=before_plugins)
+    assert hook_registry.should_execute("before_rpc_call")
+    assert not hook_registry.should_execute("after_rpc_call")
+
+
+def test_hook_should_execute_plugin(dummy_bus: lightbus.path.BusPath):
+    class TestPlugin(LightbusPlugin):
+        async def before_rpc_call(self, *, rpc_message, client):
+            pass
+
+    dummy_bus.client.plugin_registry.set_plugins([TestPlugin()])
+    assert dummy_bus.client.hook_registry.should_execute("before_rpc_call")
+    assert not dummy_bus.client.hook_registry.should_execute("after_rpc_call")
+
+
 @pytest.mark.asyncio
 async def test_exception_in_listener_shutdown(
     new_bus, worker: Worker, queue_mocker: Type[BusQueueMockerContext], caplog
@@ -451,6 +532,23 @@ def test_add_background_task(dummy_bus: lightbus.path.BusPath, event_loop):
     assert calls == 5
 
 
+def test_add_background_tasks(dummy_bus: lightbus.path.BusPath, event_loop):
+    calls = []
+
+    async def test_coroutine(n):
+        calls.append(n)
+        if len(calls) == 2:
+            raise Exception("Intentional exception: stopping lightbus dummy bus from running")
+
+    dummy_bus.client.add_background_tasks([test_coroutine(1), test_coroutine(2)])
+
+    dummy_bus.client.run_forever()
+
+    assert dummy_bus.client.exit_code
+
+    assert sorted(calls) == [1, 2]
+
+
 def test_every(dummy_bus: lightbus.path.BusPath, event_loop):
     calls = 0
 
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+
+import pytest
+
+from lightbus.client.docks.base import BaseDock
+from lightbus.client.docks.rpc_result import RpcResultDock
+from lightbus.utilities.internal_queue import InternalQueue
+
+pytestmark = pytest.mark.unit
+
+
+class FakeTransport:
+    def __init__(self, error=None):
+        self.error = error
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        if self.error:
+            raise self.error
+
+
+class FakeResultTransport:
+    def __init__(self, delay, result=None):
+        self.delay = delay
+        self.result = result
+
+    async def receive_result(self, rpc_message, return_path, options):
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+def _make_dock(dock_class):
+    return dock_class(
+        transport_registry=None,
+        api_registry=None,
+        config=None,
+        error_queue=InternalQueue(),
+        consume_from=InternalQueue(),
+        produce_to=InternalQueue(),
+    )
+
+
+@pytest.fixture
+async def dock():
+    dock = _make_dock(BaseDock)
+    yield dock
+    await dock.consumer.close()
+    await dock.producer.close()
+
+
+@pytest.fixture
+async def rpc_result_dock():
+    dock = _make_dock(RpcResultDock)
+    yield dock
+    await dock.consumer.close()
+    await dock.producer.close()
+
+
+@pytest.mark.asyncio
+async def test_close_transports(dock: BaseDock):
+    transports = [FakeTransport(), FakeTransport()]
+    await dock.close_transports(transports)
+    assert all(transport.closed for transport in transports)
+
+
+@pytest.mark.asyncio
+async def test_close_transports_error(dock: BaseDock, caplog):
+    first_error = ValueError("first")
+    transports = [
+        FakeTransport(),
+        FakeTransport(error=first_error),
+        FakeTransport(error=ValueError("second")),
+    ]
+
+    with caplog.at_level(logging.ERROR), pytest.raises(ValueError) as exc_info:
+        await dock.close_transports(transports)
+
+    # The first error is raised, but every transport still gets closed
+    assert exc_info.value is first_error
+    assert all(transport.closed for transport in transports)
+    assert len(caplog.records) == 2
+
+
+async def _run_result_listener(dock: RpcResultDock, result_transport, timeout):
+    result_queue = InternalQueue()
+    task = asyncio.ensure_future(
+        dock._result_listener(
+            result_transport=result_transport,
+            timeout=timeout,
+            rpc_message=None,
+            return_path="",
+            options={},
+            result_queue=result_queue,
+        )
+    )
+    await task
+    return task, result_queue.get_nowait()
+
+
+@pytest.mark.asyncio
+async def test_result_listener(rpc_result_dock: RpcResultDock):
+    task, result = await _run_result_listener(
+        rpc_result_dock, FakeResultTransport(delay=0, result="result"), timeout=1
+    )
+    assert result == "result"
+    assert task not in rpc_result_dock.listener_tasks
+
+
+@pytest.mark.asyncio
+async def test_result_listener_timeout(rpc_result_dock: RpcResultDock):
+    task, result = await _run_result_listener(
+        rpc_result_dock, FakeResultTransport(delay=1), timeout=0.01
+    )
+    assert isinstance(result, asyncio.TimeoutError)
+    assert not task.cancelled()
+    if hasattr(task, "cancelling"):
+        # Python 3.11+, the listener undoes its own cancellation
+        assert task.cancelling() == 0
@@ -179,6 +179,15 @@ def test_api_config_customised():
     assert config.api("my.api").event_transport.redis.batch_size == 1
 
 
+def test_api_config_cached():
+    config = Config.load_yaml(EXAMPLE_VALID_YAML)
+    assert config.api("foo") is config.api("foo") is config.api("default")
+    assert config.api("my.api") is config.api("my.api")
+    assert config.api("my.api") is not config.api("foo")
+    # The cached config is the same (shared) instance held by the root config
+    assert config.api("my.api") is config.apis()["my.api"]
+
+
 def test_cast_to_hint_validate():
     root_config = cast_to_hint(
         {"apis": {"my_api": {"validate": {"incoming": True, "outgoing": False}}}}, RootConfig
@@ -3,6 +3,7 @@ import pytest
 from collections import OrderedDict
 
 from lightbus.config import Config
+from lightbus.exceptions import PluginHookNotFound
 from lightbus.plugins import LightbusPlugin, PluginRegistry
 from lightbus.plugins.metrics import MetricsPlugin
 from lightbus.plugins.state import StatePlugin
@@ -41,6 +42,29 @@ async def test_execute_hook(mocker, plugin_registry: PluginRegistry):
     assert plugin.before_worker_start.called
 
 
+def test_has_hook(plugin_registry: PluginRegistry):
+    class TestPlugin(LightbusPlugin):
+        async def before_worker_start(self, *, client):
+            pass
+
+    assert plugin_registry.has_hook("before_worker_start") == False
+    plugin_registry.set_plugins([TestPlugin()])
+    assert plugin_registry.has_hook("before_worker_start") == True
+    # Only the hooks the plugin overrides are provided
+    assert plugin_registry.has_hook("after_worker_stopped") == False
+
+
+def test_has_hook_base_plugin(plugin_registry: PluginRegistry):
+    # The base plugin's hooks do nothing, so do not count
+    plugin_registry.set_plugins([LightbusPlugin()])
+    assert plugin_registry.has_hook("before_worker_start") == False
+
+
+def test_has_hook_invalid_name(plugin_registry: PluginRegistry):
+    with pytest.raises(PluginHookNotFound):
+        plugin_registry.has_hook("foo")
+
+
 def test_is_plugin_loaded(plugin_registry: PluginRegistry):
     assert plugin_registry.is_plugin_loaded(LightbusPlugin) == False
     plugin_registry.set_plugins([LightbusPlugin()])
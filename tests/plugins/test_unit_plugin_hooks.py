@@ -2,6 +2,7 @@
 
 """
 import asyncio
+import types
 from contextlib import contextmanager
 
 import pytest
@@ -9,7 +10,7 @@ import pytest
 from lightbus import BusClient
 from lightbus.path import BusPath
 from lightbus.message import RpcMessage, EventMessage
-from lightbus.plugins import LightbusPlugin
+from lightbus.plugins import LightbusPlugin, PluginRegistry
 from tests.conftest import Worker
 
 pytestmark = pytest.mark.unit
@@ -29,13 +30,25 @@ def track_called_hooks(mocker):
     return inner
 
 
+async def _noop_hook(self, **kwargs):
+    pass
+
+
+# Only hooks which a plugin overrides are executed, so override them all
+AllHooksPlugin = types.new_class(
+    "AllHooksPlugin",
+    (LightbusPlugin,),
+    exec_body=lambda ns: ns.update({name: _noop_hook for name in PluginRegistry.VALID_HOOK_NAMES}),
+)
+
+
 @pytest.fixture
 def add_base_plugin(dummy_bus: BusPath):
-    # Add the base plugin so that the plugins framework has something to call
-    # None of the base plugin's methods do anything, but it allows our
+    # Add a plugin so that the plugins framework has something to call
+    # None of the plugin's methods do anything, but it allows our
     # called_hooks() fixture above to detch the call
     def do_add_base_plugin():
-        dummy_bus.client.plugin_registry.set_plugins([LightbusPlugin()])
+        dummy_bus.client.plugin_registry.set_plugins([AllHooksPlugin()])
 
     return do_add_base_plugin
 
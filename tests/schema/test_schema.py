@@ -136,6 +136,25 @@ async def test_add_api(loop, schema, redis_client):
     assert await redis_client.smembers("schemas") == [b"my.test_api"]
 
 
+@pytest.mark.asyncio
+async def test_add_apis(loop, schema, redis_client):
+    class TestApi1(Api):
+        my_event = Event(["field"])
+
+        class Meta:
+            name = "my.test_api1"
+
+    class TestApi2(Api):
+        my_event = Event(["field"])
+
+        class Meta:
+            name = "my.test_api2"
+
+    await schema.add_apis([TestApi1(), TestApi2()])
+    assert set(schema.local_schemas.keys()) == {"my.test_api1", "my.test_api2"}
+    assert set(await redis_client.smembers("schemas")) == {b"my.test_api1", b"my.test_api2"}
+
+
 @pytest.mark.asyncio
 async def test_store(loop, schema, redis_client):
     schema.local_schemas["my.test_api"] = {"foo": "bar"}
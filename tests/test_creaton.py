@@ -3,7 +3,7 @@ import inspect
 import pytest
 
 from lightbus import import_bus_module, BusPath
-from lightbus.creation import get_bus
+from lightbus.creation import get_bus, create_client
 from lightbus.exceptions import FailedToImportBusModule
 
 pytestmark = pytest.mark.unit
@@ -52,3 +52,16 @@ def test_get_bus(make_test_bus_module):
     bus_module_name = make_test_bus_module()
     bus = get_bus(bus_module_name)
     assert isinstance(bus, BusPath)
+
+
+# create_client()
+
+
+@pytest.mark.parametrize("use_uvloop", [True, False], ids=["enabled", "disabled"])
+def test_create_client_use_uvloop(mocker, use_uvloop):
+    use_uvloop_policy = mocker.patch("lightbus.creation.use_uvloop_policy")
+    client = create_client(config={"bus": {"use_uvloop": use_uvloop}}, plugins=[])
+    try:
+        assert use_uvloop_policy.called is use_uvloop
+    finally:
+        client.close()
@@ -29,6 +29,25 @@ async def test_store_no_ttl(redis_schema_transport: RedisSchemaTransport, redis_
     assert ttl == -1
 
 
+@pytest.mark.asyncio
+async def test_store_many(redis_schema_transport: RedisSchemaTransport, redis_client):
+    await redis_schema_transport.store_many(
+        {"my.api": {"key": "value"}, "other.api": {"key": "other"}}, ttl_seconds=60
+    )
+    assert set(await redis_client.keys("*")) == {b"schemas", b"schema:my.api", b"schema:other.api"}
+    assert set(await redis_client.smembers("schemas")) == {b"my.api", b"other.api"}
+    assert json.loads(await redis_client.get("schema:other.api")) == {"key": "other"}
+
+    ttl = await redis_client.ttl("schema:other.api")
+    assert 59 <= ttl <= 60
+
+
+@pytest.mark.asyncio
+async def test_store_many_empty(redis_schema_transport: RedisSchemaTransport, redis_client):
+    await redis_schema_transport.store_many({}, ttl_seconds=60)
+    assert await redis_client.keys("*") == []
+
+
 @pytest.mark.asyncio
 async def test_load(redis_schema_transport: RedisSchemaTransport, redis_client):
     await redis_client.sadd("schemas", "my.api", "old.api")
@@ -111,6 +111,20 @@ def test_transport_registry_get_specific_api(redis_other_config):
     assert registry.get_schema_transport("other").transport_class == RedisSchemaTransport
 
 
+def test_transport_registry_get_cached_fallback_invalidated(redis_default_config):
+    registry = TransportRegistry().load_config(redis_default_config)
+    # Lookup falls back to the default API, which is then cached
+    default_pool = registry.get_rpc_transport("other")
+    assert default_pool is registry.get_rpc_transport("default")
+    assert registry.get_rpc_transport("other") is default_pool
+
+    # Setting a transport for the API must take precedence over any cached lookup
+    registry.set_rpc_transport(
+        "other", DebugRpcTransport, DebugRpcTransport.Config(), redis_default_config
+    )
+    assert registry.get_rpc_transport("other").transport_class == DebugRpcTransport
+
+
 def test_transport_registry_load_config(redis_default_config):
     registry = TransportRegistry().load_config(redis_default_config)
     assert registry.get_rpc_transport("default").transport_class == RedisRpcTransport
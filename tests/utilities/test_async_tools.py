@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from datetime import timedelta
 
 import pytest
@@ -8,10 +9,14 @@ from lightbus.exceptions import CannotBlockHere
 from lightbus.utilities.async_tools import (
     call_every,
     cancel,
+    cancel_and_log_exceptions,
     call_on_schedule,
     run_user_provided_callable,
     block,
+    use_uvloop_policy,
+    use_eager_task_factory,
 )
+from lightbus.utilities import async_tools
 
 pytestmark = pytest.mark.unit
 
@@ -50,9 +55,11 @@ def test_block_outside_event_loop():
 @pytest.fixture()
 async def run_for():
     async def run_for_inner(coroutine, seconds):
-        task = asyncio.ensure_future(coroutine)
-        await asyncio.sleep(seconds)
-        await cancel(task)
+        task = asyncio.get_event_loop().create_task(coroutine)
+        try:
+            await asyncio.wait_for(task, timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
 
     return run_for_inner
 
@@ -145,8 +152,6 @@ async def test_call_on_schedule_run_immediate(run_for, call_counter):
 
 @pytest.mark.asyncio
 async def test_call_on_schedule_async(run_for):
-    import schedule
-
     await_count = 0
 
     async def cb():
@@ -165,8 +170,6 @@ async def test_call_on_schedule_async(run_for):
 @pytest.mark.asyncio
 async def test_call_on_schedule_with_long_execution_time(run_for):
     """Execution time should get taken into account"""
-    import schedule
-
     await_count = 0
 
     async def cb():
@@ -183,6 +186,35 @@ async def test_call_on_schedule_with_long_execution_time(run_for):
     assert await_count == 2
 
 
+@pytest.mark.parametrize(
+    "job,expected",
+    [
+        (schedule.every(0.1).seconds, 0.1),
+        (schedule.every(2).minutes, 120),
+        (schedule.every().day, 86400),
+        (schedule.every(1).to(3).seconds, None),
+        (schedule.every().day.at("10:30"), None),
+        (schedule.every().monday, None),
+    ],
+    ids=["seconds", "minutes", "day", "random", "at_time", "start_day"],
+)
+def test_get_constant_period(job, expected):
+    assert async_tools._get_constant_period(job) == expected
+
+
+@pytest.mark.asyncio
+async def test_call_on_schedule_not_constant_period(run_for, call_counter, mocker):
+    # Schedules without a constant period are left to the schedule library to calculate
+    mocker.patch.object(async_tools, "_get_constant_period", return_value=None)
+    await run_for(
+        coroutine=call_on_schedule(
+            callback=call_counter, schedule=schedule.every(0.1).seconds, also_run_immediately=False
+        ),
+        seconds=0.25,
+    )
+    assert call_counter.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_run_user_provided_callable_regular_function():
     called = False
@@ -205,3 +237,148 @@ async def test_run_user_provided_callable_async_function():
 
     await run_user_provided_callable(call_me, args=[1], kwargs={"b": 2})
     assert called
+
+
+@pytest.mark.asyncio
+async def test_cancel_concurrently():
+    """All tasks should be cancelled before any of them are waited upon"""
+    cancelled = []
+
+    async def co(n):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # Slow shutdown
+            await asyncio.sleep(0.1)
+            cancelled.append(n)
+            raise
+
+    tasks = [asyncio.ensure_future(co(n)) for n in range(5)]
+    await asyncio.sleep(0.001)
+
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    await cancel(*tasks, None)
+    assert loop.time() - start < 0.3
+    assert sorted(cancelled) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_cancel_raises_first_exception():
+    async def co():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            raise ValueError("Error during shutdown")
+
+    task = asyncio.ensure_future(co())
+    await asyncio.sleep(0.001)
+
+    with pytest.raises(ValueError):
+        await cancel(task)
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_log_exceptions(caplog):
+    async def co():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            raise ValueError("Error during shutdown")
+
+    tasks = [asyncio.ensure_future(co()) for _ in range(2)]
+    await asyncio.sleep(0.001)
+
+    with caplog.at_level(logging.INFO, logger="lightbus.utilities.async_tools"):
+        await cancel_and_log_exceptions(*tasks, None)
+
+    # Every task's exception is logged, rather than raised
+    assert all(task.done() for task in tasks)
+    assert len(caplog.records) == 2
+
+
+def test_use_uvloop_policy_not_installed(mocker):
+    mocker.patch.object(async_tools, "uvloop", None)
+    policy = asyncio.get_event_loop_policy()
+
+    assert use_uvloop_policy() is False
+    assert asyncio.get_event_loop_policy() is policy
+
+
+@pytest.fixture()
+def fake_uvloop(mocker):
+    class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    fake_uvloop = mocker.Mock(EventLoopPolicy=EventLoopPolicy)
+    mocker.patch.object(async_tools, "uvloop", fake_uvloop)
+
+    policy = asyncio.get_event_loop_policy()
+    loop = policy.get_event_loop()
+    yield fake_uvloop
+    asyncio.set_event_loop_policy(policy)
+    asyncio.set_event_loop(loop)
+
+
+def test_use_uvloop_policy(fake_uvloop):
+    asyncio.set_event_loop(None)
+
+    assert use_uvloop_policy() is True
+    assert isinstance(asyncio.get_event_loop_policy(), fake_uvloop.EventLoopPolicy)
+
+
+@pytest.mark.asyncio
+async def test_use_uvloop_policy_loop_running(fake_uvloop):
+    policy = asyncio.get_event_loop_policy()
+
+    assert use_uvloop_policy() is False
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_use_eager_task_factory(mocker):
+    eager_task_factory = mocker.Mock()
+    mocker.patch.object(asyncio, "eager_task_factory", eager_task_factory, create=True)
+    loop = asyncio.new_event_loop()
+    try:
+        assert use_eager_task_factory(loop) is True
+        assert loop.get_task_factory() is eager_task_factory
+    finally:
+        loop.close()
+
+
+def test_use_eager_task_factory_existing_factory(mocker):
+    mocker.patch.object(asyncio, "eager_task_factory", mocker.Mock(), create=True)
+    task_factory = mocker.Mock()
+    loop = asyncio.new_event_loop()
+    loop.set_task_factory(task_factory)
+    try:
+        assert use_eager_task_factory(loop) is False
+        assert loop.get_task_factory() is task_factory
+    finally:
+        loop.close()
+
+
+def test_use_eager_task_factory_unavailable(mocker):
+    if hasattr(asyncio, "eager_task_factory"):
+        mocker.patch.object(asyncio, "eager_task_factory", None)
+    loop = asyncio.new_event_loop()
+    try:
+        assert use_eager_task_factory(loop) is False
+        assert loop.get_task_factory() is None
+    finally:
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_call_every_checks_callback_type_once(run_for, mocker):
+    async def cb():
+        pass
+
+    iscoroutinefunction = mocker.spy(asyncio, "iscoroutinefunction")
+    await run_for(
+        coroutine=call_every(
+            callback=cb, timedelta=timedelta(seconds=0.01), also_run_immediately=True
+        ),
+        seconds=0.05,
+    )
+    assert iscoroutinefunction.call_count == 1
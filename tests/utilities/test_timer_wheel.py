@@ -0,0 +1,215 @@
+import asyncio
+
+import pytest
+
+from lightbus.utilities.async_tools import cancel
+from lightbus.utilities.timer_wheel import TimerWheel
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture()
+async def wheel():
+    wheel = TimerWheel(resolution=0.01, buckets=8)
+    wheel.start()
+    yield wheel
+    wheel.close()
+
+
+def test_buckets_power_of_two():
+    with pytest.raises(ValueError):
+        TimerWheel(buckets=100)
+
+
+@pytest.mark.asyncio
+async def test_schedule(wheel: TimerWheel):
+    calls = []
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    wheel.schedule(0.03, lambda: calls.append(loop.time()))
+
+    await asyncio.sleep(0.1)
+    assert len(calls) == 1
+    # Never early
+    assert calls[0] - start >= 0.03
+
+
+@pytest.mark.asyncio
+async def test_schedule_args(wheel: TimerWheel):
+    calls = []
+    wheel.schedule(0, calls.append, "a")
+
+    await asyncio.sleep(0.05)
+    assert calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_schedule_ordering(wheel: TimerWheel):
+    calls = []
+    wheel.schedule(0.04, calls.append, 2)
+    wheel.schedule(0.01, calls.append, 1)
+
+    await asyncio.sleep(0.1)
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_schedule_overflow(wheel: TimerWheel):
+    # Further out than one revolution of the wheel (8 * 0.01 seconds)
+    calls = []
+    wheel.schedule(0.15, calls.append, 1)
+    assert wheel._overflow
+
+    await asyncio.sleep(0.1)
+    assert calls == []
+    await asyncio.sleep(0.1)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_schedule_overflow_same_deadline(wheel: TimerWheel):
+    # Timers cannot be compared, so must not be compared by the overflow heap
+    calls = []
+    wheel.schedule(0.15, calls.append, 1)
+    wheel.schedule(0.15, calls.append, 2)
+    wheel.schedule(0.12, calls.append, 0)
+
+    await asyncio.sleep(0.25)
+    assert calls == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_cancel(wheel: TimerWheel):
+    calls = []
+    wheel.schedule(0.02, calls.append, 1).cancel()
+    wheel.schedule(0.15, calls.append, 2).cancel()
+
+    await asyncio.sleep(0.2)
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_callback_error(wheel: TimerWheel):
+    calls = []
+    wheel.schedule(0.01, lambda: 1 / 0)
+    wheel.schedule(0.01, calls.append, 1)
+
+    await asyncio.sleep(0.05)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_sleep(wheel: TimerWheel):
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    await wheel.sleep(0.03)
+    assert 0.03 <= loop.time() - start < 0.1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("closed", [True, False], ids=["closed", "not-started"])
+async def test_sleep_not_running(closed):
+    # The wheel's timers would never fire, so asyncio.sleep() is used instead
+    wheel = TimerWheel(resolution=0.01, buckets=8)
+    if closed:
+        wheel.start()
+        wheel.close()
+
+    await asyncio.wait_for(wheel.sleep(0.01), timeout=0.5)
+    assert not wheel._pending_ticks
+
+
+@pytest.mark.asyncio
+async def test_sleep_cancelled(wheel: TimerWheel):
+    task = asyncio.ensure_future(wheel.sleep(0.03))
+    await asyncio.sleep(0)
+    await cancel(task)
+
+    assert task.cancelled()
+    assert not any(t for bucket in wheel._wheel for t in bucket if not t.cancelled)
+
+
+@pytest.mark.asyncio
+async def test_next_wakeup():
+    wheel = TimerWheel(resolution=0.01, buckets=8)
+    assert wheel._get_next_wakeup() is None
+
+    later = wheel.schedule(0.05, lambda: None)
+    sooner = wheel.schedule(0.02, lambda: None)
+    assert wheel._pending_ticks == [sooner.tick, later.tick]
+    assert wheel._get_next_wakeup() == sooner.tick * 0.01
+
+    # Buckets containing only cancelled timers are skipped (and discarded)
+    sooner.cancel()
+    assert wheel._get_next_wakeup() == later.tick * 0.01
+    assert wheel._pending_ticks == [later.tick]
+
+
+@pytest.mark.asyncio
+async def test_start_close():
+    wheel = TimerWheel(resolution=0.01, buckets=8)
+    calls = []
+
+    # Not started, so nothing fires
+    wheel.schedule(0.01, calls.append, 1)
+    await asyncio.sleep(0.05)
+    assert calls == []
+
+    # Starting fires any timers which are already due
+    wheel.start()
+    await asyncio.sleep(0.02)
+    assert calls == [1]
+
+    wheel.schedule(0.02, calls.append, 2)
+    wheel.close()
+    assert wheel._wakeup_handle is None
+    await asyncio.sleep(0.05)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_wakeup_only_rearmed_when_sooner(wheel: TimerWheel):
+    assert wheel._next_wakeup == -1
+
+    wheel.schedule(0.05, lambda: None)
+    first_wakeup = wheel._next_wakeup
+    first_handle = wheel._wakeup_handle
+    assert first_wakeup > 0
+
+    # Later timer, so the existing wakeup stands
+    wheel.schedule(0.07, lambda: None)
+    assert wheel._next_wakeup == first_wakeup
+    assert wheel._wakeup_handle is first_handle
+
+    # Sooner timer, so the wakeup is rescheduled
+    wheel.schedule(0.01, lambda: None)
+    assert wheel._next_wakeup < first_wakeup
+    assert first_handle.cancelled()
+
+    # No wakeup is set once all the timers have fired
+    await asyncio.sleep(0.1)
+    assert wheel._next_wakeup == -1
+
+
+@pytest.mark.asyncio
+async def test_overflow_compacted_when_mostly_cancelled():
+    wheel = TimerWheel(resolution=0.01, buckets=8)
+    timers = [wheel.schedule(10 + n, lambda: None) for n in range(200)]
+
+    # Half cancelled, so no rebuild yet
+    for timer in timers[:100]:
+        timer.cancel()
+    wheel.advance()
+    assert len(wheel._overflow) == 200
+    assert wheel._overflow_cancelled == 100
+
+    # Cancelling an already cancelled timer doesn't count twice
+    timers[0].cancel()
+    assert wheel._overflow_cancelled == 100
+
+    # Now more than half are cancelled, so the heap is rebuilt
+    timers[100].cancel()
+    wheel.advance()
+    assert len(wheel._overflow) == 99
+    assert wheel._overflow_cancelled == 0
+    assert wheel._overflow[0][2] is timers[101]
@@ -1,5 +1,7 @@
 import functools
+import gc
 import logging
+import weakref
 from datetime import datetime, timezone, date
 from decimal import Decimal
 from enum import Enum
@@ -12,7 +14,7 @@ from dataclasses import dataclass
 import dateutil.parser
 
 import lightbus.utilities.casting
-from lightbus.utilities.casting import cast_to_signature, cast_to_hint
+from lightbus.utilities.casting import cast_to_signature, cast_to_hint, get_callable_type_hints
 from lightbus.utilities.frozendict import frozendict
 
 pytestmark = pytest.mark.unit
@@ -50,6 +52,40 @@ def test_cast_to_signature_no_annotations():
     assert casted == {"a": "1", "b": 2, "c": obj}
 
 
+def test_cast_to_signature_bound_method():
+    class Foo:
+        def fn(self, a: int, b: str, c):
+            pass
+
+    obj = object()
+    foo = Foo()
+    casted = cast_to_signature(callable=foo.fn, parameters={"a": "1", "b": 2, "c": obj})
+    assert casted == {"a": 1, "b": "2", "c": obj}
+    # Hints for the bound method are cached against the underlying function
+    assert get_callable_type_hints(foo.fn) is get_callable_type_hints(Foo.fn)
+
+
+def test_get_callable_type_hints_read_only():
+    def fn(a: int):
+        pass
+
+    with pytest.raises(TypeError):
+        get_callable_type_hints(fn)["a"] = str
+    assert get_callable_type_hints(fn) == {"a": int}
+
+
+def test_get_callable_type_hints_not_kept_alive():
+    def fn(a: int):
+        pass
+
+    get_callable_type_hints(fn)
+    fn_ref = weakref.ref(fn)
+    del fn
+    gc.collect()
+    # The cache does not prevent the function from being garbage collected
+    assert fn_ref() is None
+
+
 def UTC(args):
     pass
 